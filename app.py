@@ -10,9 +10,26 @@ import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
+from pathlib import Path
 import joblib
-import warnings
-warnings.filterwarnings('ignore')
+
+# Random generator for forecast noise
+rng = np.random.default_rng()
+
+# Shared Plotly chart config (no toolbar, no scroll zoom)
+PLOTLY_CONFIG = {'displayModeBar': False, 'responsive': True, 'scrollZoom': False}
+
+# Column dtypes for the crime dataset (categorical labels, narrow numerics)
+DATA_DTYPES = {
+    'City': 'category', 'State': 'category',
+    'Crime_Type': 'category', 'Crime_Category': 'category',
+    'Year': 'int16', 'Month': 'int8', 'Incidents_Reported': 'int32',
+    'Cases_Charge_Sheeted': 'int32', 'Cases_Convicted': 'int32',
+    'Crime_Rate_Per_100K': 'float32', 'Population_Lakhs': 'float32'
+}
+
+# App stylesheet, resolved next to this file so the app runs from any directory
+CSS_PATH = Path(__file__).parent / 'assets' / 'style.css'
 
 # Configure page
 st.set_page_config(
@@ -22,64 +39,70 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for modern aesthetics
-st.markdown("""
-<style>
-    .main {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-    }
-    .stApp {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-    }
-    .block-container {
-        background-color: rgba(255, 255, 255, 0.95);
-        padding: 2rem;
-        border-radius: 10px;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-    }
-    h1 {
-        color: #667eea;
-        font-weight: 700;
-        text-align: center;
-        padding: 1rem 0;
-    }
-    h2, h3 {
-        color: #764ba2;
-    }
-    .stButton>button {
-        background: linear-gradient(90deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        border: none;
-        padding: 0.6rem 2rem;
-        border-radius: 8px;
-        font-weight: 600;
-        transition: all 0.3s ease;
-    }
-    .stButton>button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 6px 12px rgba(102, 126, 234, 0.4);
-    }
-    .metric-card {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        padding: 1.5rem;
-        border-radius: 10px;
-        text-align: center;
-        margin: 0.5rem 0;
-    }
-</style>
-""", unsafe_allow_html=True)
+@st.cache_resource
+def load_css():
+    """Read the app stylesheet once per process"""
+    try:
+        return f"<style>\n{CSS_PATH.read_text()}</style>"
+    except OSError:
+        return ""  # Fall back to Streamlit's default styling
 
-@st.cache_data
+@st.cache_resource
 def load_data():
-    """Load crime dataset"""
+    """Load crime dataset (shared read-only across sessions)"""
     try:
-        df = pd.read_csv('data/raw/india_crime_data_2019_2024.csv')
-        df['Date'] = pd.to_datetime(df['Date'])
-        return df
-    except:
-        st.error("Could not load crime data. Please ensure data file exists.")
-        return None
+        df = pd.read_parquet('data/raw/india_crime_data_2019_2024.parquet')
+    except Exception:
+        # Fall back to the CSV export
+        try:
+            df = pd.read_csv('data/raw/india_crime_data_2019_2024.csv', dtype=DATA_DTYPES)
+            df['Date'] = pd.to_datetime(df['Date'])
+        except:
+            st.error("Could not load crime data. Please ensure data file exists.")
+            return None
+    
+    # Categorical labels and narrow numerics for faster filters and groupbys
+    return df.astype(DATA_DTYPES)
+
+@st.cache_resource
+def get_unique_cities(_df):
+    """Cities in the dataset (categories are already sorted)"""
+    return _df['City'].cat.categories.tolist()
+
+@st.cache_resource
+def get_crime_types(_df):
+    """Crime types in the dataset (categories are already sorted)"""
+    return _df['Crime_Type'].cat.categories.tolist()
+
+@st.cache_resource
+def build_monthly_index(_df):
+    """Precompute monthly incident totals per (city, crime type), shared read-only"""
+    def monthly_totals(keys):
+        monthly = _df.groupby(keys + ['Year', 'Month'], observed=True)['Incidents_Reported'].sum().reset_index()
+        # Months since epoch -> datetime64, avoiding to_datetime's per-row parsing
+        years = monthly['Year'].to_numpy(dtype=np.int64)
+        months = monthly['Month'].to_numpy(dtype=np.int64)
+        month_offsets = (years - 1970) * 12 + (months - 1)
+        monthly['Date'] = month_offsets.astype('datetime64[M]').astype('datetime64[ns]')
+        return monthly
+    
+    # One grouped pass per level, then split into per-selection frames
+    columns = ['Year', 'Month', 'Incidents_Reported', 'Date']
+    index = {}
+    by_crime = monthly_totals(['City', 'Crime_Type'])
+    for (city, crime_type), group in by_crime.groupby(['City', 'Crime_Type'], sort=False, observed=True):
+        index[(city, crime_type)] = group[columns].reset_index(drop=True)
+    by_city = monthly_totals(['City'])
+    for city, group in by_city.groupby('City', sort=False, observed=True):
+        index[(city, 'All Crimes')] = group[columns].reset_index(drop=True)
+    return index
+
+def decimate(data, max_points=2000):
+    """Evenly sample data down to max_points rows for plotting, keeping the first and last rows"""
+    if len(data) <= max_points:
+        return data
+    positions = np.linspace(0, len(data) - 1, max_points).round().astype(int)
+    return data.iloc[positions]
 
 def simple_forecast(city_data, months_ahead=6):
     """Simple forecasting using moving average and trend"""
@@ -93,17 +116,19 @@ def simple_forecast(city_data, months_ahead=6):
     # Use last 6 months average as base
     base = city_data.tail(6).mean()
     
-    # Forecast
-    forecasts = []
-    for i in range(1, months_ahead + 1):
-        forecast_value = base + (trend * i)
-        # Add some realistic variation
-        forecast_value = max(0, forecast_value * np.random.uniform(0.95, 1.05))
-        forecasts.append(forecast_value)
+    # Forecast, with some realistic variation drawn in one call
+    steps = np.arange(1, months_ahead + 1, dtype=np.float64)
+    noise = rng.uniform(0.95, 1.05, months_ahead)
+    forecasts = np.maximum(0.0, (base + trend * steps) * noise)
     
-    return forecasts
+    return forecasts.tolist()
 
 def main():
+    # Custom CSS; re-emitted each run since Streamlit drops elements not rendered
+    css = load_css()
+    if css:
+        st.markdown(css, unsafe_allow_html=True)
+    
     st.title("🚨 Crime Rate Prediction System")
     st.markdown("### Predict Future Crime Rates for Indian Cities")
     
@@ -111,12 +136,13 @@ def main():
     df = load_data()
     if df is None:
         return
+    monthly_index = build_monthly_index(df)
     
     # Sidebar
     st.sidebar.header("⚙️ Configuration")
     
     # City selection
-    cities = sorted(df['City'].unique())
+    cities = get_unique_cities(df)
     selected_city = st.sidebar.selectbox(
         "🏙️ Select City",
         cities,
@@ -124,7 +150,7 @@ def main():
     )
     
     # Crime type selection
-    crime_types = ['All Crimes'] + sorted(df['Crime_Type'].unique().tolist())
+    crime_types = ['All Crimes'] + get_crime_types(df)
     selected_crime = st.sidebar.selectbox(
         "🔍 Crime Type",
         crime_types,
@@ -148,10 +174,11 @@ def main():
     if selected_crime != 'All Crimes':
         city_df = city_df[city_df['Crime_Type'] == selected_crime]
     
-    # Aggregate monthly
-    monthly_data = city_df.groupby(['Year', 'Month'])['Incidents_Reported'].sum().reset_index()
-    monthly_data['Date'] = pd.to_datetime(monthly_data[['Year', 'Month']].assign(day=1))
-    monthly_data = monthly_data.sort_values('Date')
+    # Keep zoom/pan across reruns only while the selection is unchanged
+    chart_revision = f"{selected_city}|{selected_crime}"
+    
+    # Monthly aggregate
+    monthly_data = monthly_index[(selected_city, selected_crime)]
     
     # Current stats
     total_crimes = city_df['Incidents_Reported'].sum()
@@ -210,10 +237,11 @@ def main():
                 #  Historical trend
                 fig = go.Figure()
                 
-                # Historical data
-                fig.add_trace(go.Scatter(
-                    x=monthly_data['Date'],
-                    y=monthly_data['Incidents_Reported'],
+                # Historical data (decimated for display only)
+                plot_data = decimate(monthly_data)
+                fig.add_trace(go.Scattergl(
+                    x=plot_data['Date'],
+                    y=plot_data['Incidents_Reported'],
                     mode='lines+markers',
                     name='Historical',
                     line=dict(color='#667eea', width=3),
@@ -221,7 +249,7 @@ def main():
                 ))
                 
                 # Forecast
-                fig.add_trace(go.Scatter(
+                fig.add_trace(go.Scattergl(
                     x=forecast_df['Date'],
                     y=forecast_df['Predicted_Incidents'],
                     mode='lines+markers',
@@ -236,10 +264,11 @@ def main():
                     yaxis_title="Crime Incidents",
                     template="plotly_white",
                     height=500,
-                    hovermode='x unified'
+                    hovermode='x',
+                    uirevision=chart_revision
                 )
                 
-                st.plotly_chart(fig, width='stretch')
+                st.plotly_chart(fig, width='stretch', theme=None, config=PLOTLY_CONFIG)
                 
                 # Display forecast table
                 st.subheader("📋 Forecast Details")
@@ -274,33 +303,46 @@ def main():
     st.subheader("📊 Historical Trends")
     
     # Yearly comparison
-    yearly_crimes = city_df.groupby('Year')['Incidents_Reported'].sum()
+    years = city_df['Year'].to_numpy()
+    incidents = city_df['Incidents_Reported'].to_numpy()
+    first_year = years.min()
+    yearly_y = np.bincount(years - first_year, weights=incidents).astype(np.int64)
+    yearly_x = np.arange(first_year, first_year + len(yearly_y))
     
-    fig_yearly = px.bar(
-        x=yearly_crimes.index,
-        y=yearly_crimes.values,
-        labels={'x': 'Year', 'y': 'Total Incidents'},
+    fig_yearly = go.Figure(go.Bar(
+        x=yearly_x,
+        y=yearly_y,
+        marker=dict(color=yearly_y, colorscale='Purples', showscale=True)
+    ))
+    fig_yearly.update_layout(
         title=f"Yearly Crime Trend - {selected_city}",
-        color=yearly_crimes.values,
-        color_continuous_scale='Purples'
+        xaxis_title="Year",
+        yaxis_title="Total Incidents",
+        template="plotly_white",
+        height=400,
+        uirevision=chart_revision
     )
-    fig_yearly.update_layout(template="plotly_white", height=400)
-    st.plotly_chart(fig_yearly, width='stretch')
+    st.plotly_chart(fig_yearly, width='stretch', theme=None, config=PLOTLY_CONFIG)
     
     # Crime category distribution
     if selected_crime == 'All Crimes':
         st.subheader("🔍 Crime Category Distribution")
-        category_dist = city_df.groupby('Crime_Category')['Incidents_Reported'].sum().sort_values(ascending=False)
+        category_dist = city_df.groupby('Crime_Category', observed=True, sort=False)['Incidents_Reported'].sum().sort_values(ascending=False)
         
-        fig_pie = px.pie(
+        fig_pie = go.Figure(go.Pie(
+            labels=category_dist.index,
             values=category_dist.values,
-            names=category_dist.index,
-            title=f"Crime Categories in {selected_city}",
             hole=0.4,
-            color_discrete_sequence=px.colors.sequential.Purples_r
+            marker=dict(colors=px.colors.sequential.Purples_r),
+            textposition='inside',
+            textinfo='percent+label'
+        ))
+        fig_pie.update_layout(
+            title=f"Crime Categories in {selected_city}",
+            template="plotly_white",
+            uirevision=chart_revision
         )
-        fig_pie.update_traces(textposition='inside', textinfo='percent+label')
-        st.plotly_chart(fig_pie, width='stretch')
+        st.plotly_chart(fig_pie, width='stretch', theme=None, config=PLOTLY_CONFIG)
 
     # Footer
     st.markdown("---")
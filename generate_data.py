@@ -5,12 +5,9 @@ Creates realistic synthetic crime data based on NCRB patterns for demonstration
 
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
-import random
 
-# Set random seed for reproducibility
-np.random.seed(42)
-random.seed(42)
+# Seeded random generator for reproducibility
+rng = np.random.default_rng(42)
 
 # Indian cities
 CITIES = [
@@ -38,6 +35,32 @@ CITY_POPULATIONS = {
     "Visakhapatnam": 2.2, "Pimpri-Chinchwad": 2.1, "Patna": 2.5, "Vadodara": 2.2
 }
 
+# City to state mapping
+STATE_MAP = {
+    "Delhi": "Delhi", "Mumbai": "Maharashtra", "Bangalore": "Karnataka",
+    "Hyderabad": "Telangana", "Ahmedabad": "Gujarat", "Chennai": "Tamil Nadu",
+    "Kolkata": "West Bengal", "Surat": "Gujarat", "Pune": "Maharashtra",
+    "Jaipur": "Rajasthan", "Lucknow": "Uttar Pradesh", "Kanpur": "Uttar Pradesh",
+    "Nagpur": "Maharashtra", "Indore": "Madhya Pradesh", "Thane": "Maharashtra",
+    "Bhopal": "Madhya Pradesh", "Visakhapatnam": "Andhra Pradesh",
+    "Pimpri-Chinchwad": "Maharashtra", "Patna": "Bihar", "Vadodara": "Gujarat"
+}
+
+# Crime type to category mapping
+CATEGORY_MAP = {
+    "Murder": "Violent Crimes", "Attempt to Murder": "Violent Crimes",
+    "Rape": "Violent Crimes", "Dowry Deaths": "Violent Crimes",
+    "Kidnapping & Abduction": "Crimes Against Person", "Robbery": "Crimes Against Person",
+    "Dacoity": "Crimes Against Person",
+    "Burglary": "Property Crimes", "Theft": "Property Crimes",
+    "Motor Vehicle Theft": "Property Crimes",
+    "Cybercrime": "Economic Crimes", "Economic Offences": "Economic Crimes",
+    "Forgery": "Economic Crimes", "Cheating": "Economic Crimes",
+    "Criminal Breach of Trust": "Economic Crimes",
+    "Assault on Women": "Crimes Against Women",
+    "Riots": "Other Crimes", "Hurt": "Other Crimes", "Arson": "Other Crimes"
+}
+
 def generate_crime_data(start_date="2019-01-01", end_date="2024-12-31"):
     """
     Generate synthetic crime data for Indian cities
@@ -50,117 +73,97 @@ def generate_crime_data(start_date="2019-01-01", end_date="2024-12-31"):
     - DataFrame with crime records
     """
     
-    data = []
-    
-    # Generate date range
-    start = datetime.strptime(start_date, "%Y-%m-%d")
-    end = datetime.strptime(end_date, "%Y-%m-%d")
-    
-    current_date = start
-    
-    while current_date <= end:
-        year = current_date.year
-        month = current_date.month
-        
-        for city in CITIES:
-            population = CITY_POPULATIONS[city]
-            
-            # Base crime rate per 100,000 population (varies by city)
-            base_rate = np.random.uniform(200, 600) * (population / 10)
-            
-            # Apply seasonal factors
-            seasonal_factor = 1.0
-            if month in [3, 4, 5]:  # Summer months - slightly higher
-                seasonal_factor = 1.15
-            elif month in [10, 11]:  # Festival season - variable
-                seasonal_factor = np.random.uniform(0.9, 1.2)
-            elif month in [12, 1]:  # Winter - slightly lower
-                seasonal_factor = 0.95
-                
-            # Apply year-wise trend (slight increase over years)
-            year_factor = 1 + (year - 2019) * 0.03
-            
-            # Weekend effect (weekends might have different patterns)
-            # day_of_week = current_date.weekday()
-            # weekend_factor = 1.1 if day_of_week >= 5 else 1.0
-            
-            for crime_type in CRIME_TYPES:
-                # Crime type specific factors
-                crime_factor = 1.0
-                
-                if crime_type in ["Murder", "Dacoity", "Dowry Deaths"]:
-                    crime_factor = 0.05  # Rare crimes
-                elif crime_type in ["Rape", "Kidnapping & Abduction", "Robbery"]:
-                    crime_factor = 0.15  # Serious crimes - moderate
-                elif crime_type in ["Theft", "Motor Vehicle Theft", "Burglary"]:
-                    crime_factor = 0.4  # Common property crimes
-                elif crime_type in ["Cybercrime"]:
-                    crime_factor = 0.2 * (1 + (year - 2019) * 0.3)  # Increasing trend
-                elif crime_type in ["Hurt", "Assault on Women", "Cheating"]:
-                    crime_factor = 0.25
-                else:
-                    crime_factor = 0.1
-                
-                # Calculate number of incidents
-                incidents = int(base_rate * seasonal_factor * year_factor * crime_factor)
-                
-                # Add random variation
-                incidents = max(0, incidents + np.random.randint(-5, 6))
-                
-                # Calculate crime rate per 100,000 population
-                crime_rate = (incidents / population) * 100
-                
-                data.append({
-                    "Year": year,
-                    "Month": month,
-                    "Date": current_date.strftime("%Y-%m-%d"),
-                    "City": city,
-                    "State": get_state(city),
-                    "Crime_Type": crime_type,
-                    "Crime_Category": get_crime_category(crime_type),
-                    "Incidents_Reported": incidents,
-                    "Population_Lakhs": round(population * 10, 1),
-                    "Crime_Rate_Per_100K": round(crime_rate, 2),
-                    "Cases_Charge_Sheeted": int(incidents * np.random.uniform(0.6, 0.85)),
-                    "Cases_Convicted": int(incidents * np.random.uniform(0.15, 0.35)),
-                })
-        
-        # Move to next month
-        if current_date.month == 12:
-            current_date = datetime(current_date.year + 1, 1, 1)
-        else:
-            current_date = datetime(current_date.year, current_date.month + 1, 1)
-    
-    df = pd.DataFrame(data)
+    # Generate monthly date range
+    dates = pd.date_range(start=start_date, end=end_date, freq="MS")
+    year_arr = dates.year.to_numpy()
+    month_arr = dates.month.to_numpy()
+    
+    n_months, n_cities, n_crimes = len(dates), len(CITIES), len(CRIME_TYPES)
+    shape = (n_months, n_cities, n_crimes)
+    
+    population = np.array([CITY_POPULATIONS[city] for city in CITIES])
+    
+    # Base crime rate per 100,000 population (varies by city and month)
+    base_rate = rng.uniform(200, 600, (n_months, n_cities)) * (population / 10)
+    
+    # Apply seasonal factors
+    seasonal_factor = np.ones((n_months, n_cities))
+    seasonal_factor[np.isin(month_arr, [3, 4, 5])] = 1.15  # Summer months - slightly higher
+    festival = np.isin(month_arr, [10, 11])  # Festival season - variable
+    seasonal_factor[festival] = rng.uniform(0.9, 1.2, (festival.sum(), n_cities))
+    seasonal_factor[np.isin(month_arr, [12, 1])] = 0.95  # Winter - slightly lower
+    
+    # Apply year-wise trend (slight increase over years)
+    year_factor = 1 + (year_arr - 2019) * 0.03
+    
+    # Crime type specific factors
+    crime_factor = np.full((n_months, n_crimes), 0.1)
+    for crime_types, factor in [
+        (["Murder", "Dacoity", "Dowry Deaths"], 0.05),  # Rare crimes
+        (["Rape", "Kidnapping & Abduction", "Robbery"], 0.15),  # Serious crimes - moderate
+        (["Theft", "Motor Vehicle Theft", "Burglary"], 0.4),  # Common property crimes
+        (["Hurt", "Assault on Women", "Cheating"], 0.25),
+    ]:
+        crime_factor[:, np.isin(CRIME_TYPES, crime_types)] = factor
+    # Cybercrime has an increasing trend
+    crime_factor[:, CRIME_TYPES.index("Cybercrime")] = 0.2 * (1 + (year_arr - 2019) * 0.3)
+    
+    # Calculate number of incidents
+    incidents = (
+        base_rate[:, :, None]
+        * seasonal_factor[:, :, None]
+        * year_factor[:, None, None]
+        * crime_factor[:, None, :]
+    ).astype(int)
+    
+    # Add random variation
+    incidents = np.clip(incidents + rng.integers(-5, 6, shape), 0, None)
+    
+    # Calculate crime rate per 100,000 population
+    crime_rate = (incidents / population[None, :, None]) * 100
+    
+    # Map state/category once per unique city/crime and broadcast via codes
+    city_cat = pd.Categorical(CITIES)
+    crime_cat = pd.Categorical(CRIME_TYPES)
+    state_cat = pd.Categorical([get_state(city) for city in city_cat.categories])
+    category_cat = pd.Categorical([get_crime_category(c) for c in crime_cat.categories])
+    
+    # One flat array per column (rows ordered month -> city -> crime type)
+    n_rows = incidents.size
+    year_col = np.repeat(year_arr, n_cities * n_crimes)
+    month_col = np.repeat(month_arr, n_cities * n_crimes)
+    city_idx = np.tile(np.repeat(city_cat.codes, n_crimes), n_months)
+    crime_idx = np.tile(crime_cat.codes, n_months * n_cities)
+    incidents = incidents.ravel().astype(np.int32)
+    # Charge-sheet (60-85%) and conviction (15-35%) ratios in one bulk draw
+    ratios = rng.uniform([[0.6], [0.15]], [[0.85], [0.35]], (2, n_rows))
+    chargesheeted, convicted = (incidents * ratios).astype(np.int32)
+    
+    df = pd.DataFrame({
+        "Year": year_col,
+        "Month": month_col,
+        "Date": np.repeat(dates.to_numpy(), n_cities * n_crimes),
+        "City": pd.Categorical.from_codes(city_idx, categories=city_cat.categories),
+        "State": pd.Categorical.from_codes(state_cat.codes[city_idx], categories=state_cat.categories),
+        "Crime_Type": pd.Categorical.from_codes(crime_idx, categories=crime_cat.categories),
+        "Crime_Category": pd.Categorical.from_codes(
+            category_cat.codes[crime_idx], categories=category_cat.categories
+        ),
+        "Incidents_Reported": incidents,
+        "Population_Lakhs": np.tile(np.repeat(np.round(population * 10, 1), n_crimes), n_months),
+        "Crime_Rate_Per_100K": np.round(crime_rate, 2).ravel(),
+        "Cases_Charge_Sheeted": chargesheeted,
+        "Cases_Convicted": convicted,
+    })
     return df
 
 def get_state(city):
     """Map city to state"""
-    state_mapping = {
-        "Delhi": "Delhi", "Mumbai": "Maharashtra", "Bangalore": "Karnataka",
-        "Hyderabad": "Telangana", "Ahmedabad": "Gujarat", "Chennai": "Tamil Nadu",
-        "Kolkata": "West Bengal", "Surat": "Gujarat", "Pune": "Maharashtra",
-        "Jaipur": "Rajasthan", "Lucknow": "Uttar Pradesh", "Kanpur": "Uttar Pradesh",
-        "Nagpur": "Maharashtra", "Indore": "Madhya Pradesh", "Thane": "Maharashtra",
-        "Bhopal": "Madhya Pradesh", "Visakhapatnam": "Andhra Pradesh",
-        "Pimpri-Chinchwad": "Maharashtra", "Patna": "Bihar", "Vadodara": "Gujarat"
-    }
-    return state_mapping.get(city, "Unknown")
+    return STATE_MAP.get(city, "Unknown")
 
 def get_crime_category(crime_type):
     """Categorize crime types"""
-    if crime_type in ["Murder", "Attempt to Murder", "Rape", "Dowry Deaths"]:
-        return "Violent Crimes"
-    elif crime_type in ["Kidnapping & Abduction", "Robbery", "Dacoity"]:
-        return "Crimes Against Person"
-    elif crime_type in ["Burglary", "Theft", "Motor Vehicle Theft"]:
-        return "Property Crimes"
-    elif crime_type in ["Cybercrime", "Economic Offences", "Forgery", "Cheating", "Criminal Breach of Trust"]:
-        return "Economic Crimes"
-    elif crime_type in ["Assault on Women"]:
-        return "Crimes Against Women"
-    else:
-        return "Other Crimes"
+    return CATEGORY_MAP.get(crime_type, "Other Crimes")
 
 if __name__ == "__main__":
     print("Generating synthetic crime data for Indian cities...")
@@ -169,14 +172,25 @@ if __name__ == "__main__":
     df = generate_crime_data("2019-01-01", "2024-12-31")
     
     print(f"\nGenerated {len(df)} records")
-    print(f"Date range: {df['Date'].min()} to {df['Date'].max()}")
+    print(f"Date range: {df['Date'].min():%Y-%m-%d} to {df['Date'].max():%Y-%m-%d}")
     print(f"Cities: {df['City'].nunique()}")
     print(f"Crime types: {df['Crime_Type'].nunique()}")
     
-    # Save to CSV
+    # Use compact column dtypes for storage
+    df = df.astype({
+        "City": "category", "State": "category",
+        "Crime_Type": "category", "Crime_Category": "category",
+        "Year": "int16", "Month": "int8", "Incidents_Reported": "int32",
+        "Cases_Charge_Sheeted": "int32", "Cases_Convicted": "int32",
+        "Crime_Rate_Per_100K": "float32", "Population_Lakhs": "float32",
+    })
+    
+    # Save to Parquet (used by the app) and CSV (used by the notebooks)
     output_path = "data/raw/india_crime_data_2019_2024.csv"
+    parquet_path = output_path.replace(".csv", ".parquet")
+    df.to_parquet(parquet_path, engine="pyarrow", compression="zstd", index=False)
     df.to_csv(output_path, index=False)
-    print(f"\nData saved to: {output_path}")
+    print(f"\nData saved to: {parquet_path} and {output_path}")
     
     # Display summary statistics
     print("\n" + "="*60)
@@ -187,13 +201,13 @@ if __name__ == "__main__":
     print(df.groupby("Year")["Incidents_Reported"].sum().sort_index())
     
     print("\nTop 5 cities by total crime count:")
-    print(df.groupby("City")["Incidents_Reported"].sum().sort_values(ascending=False).head())
+    print(df.groupby("City", observed=True)["Incidents_Reported"].sum().sort_values(ascending=False).head())
     
     print("\nTop 10 crime types by frequency:")
-    print(df.groupby("Crime_Type")["Incidents_Reported"].sum().sort_values(ascending=False).head(10))
+    print(df.groupby("Crime_Type", observed=True)["Incidents_Reported"].sum().sort_values(ascending=False).head(10))
     
     print("\nCrime distribution by category:")
-    print(df.groupby("Crime_Category")["Incidents_Reported"].sum().sort_values(ascending=False))
+    print(df.groupby("Crime_Category", observed=True)["Incidents_Reported"].sum().sort_values(ascending=False))
     
     print("\nSample data:")
     print(df.head(10))